@@ -1,15 +1,103 @@
+import math
+import sys
+
 import numpy as np
+import sympy
+from numba import njit
 import argparse
 
 def get_function(expression):
     """
     Create a function from a string expression.
+
+    The expression is compiled to bytecode once, so calling the returned
+    function does not re-parse the string on every evaluation. When the
+    expression also compiles cleanly under Numba, the jitted function is
+    returned instead; the make_* solver factories can close over it and
+    run their whole loop in machine code.
     """
+    try:
+        namespace = {"np": np}
+        exec(compile("def _f(x):\n    return " + expression, "<expression>", "exec"), namespace)
+        jitted = njit(namespace["_f"])
+        jitted(1.0)  # force compilation; falls back if Numba rejects the expression
+        return jitted
+    except Exception:
+        pass
+    code = compile(expression, "<expression>", "eval")
+    env = {"np": np}
     def f(x):
-        return eval(expression, {"x": x, "np": np})
+        value = eval(code, env, {"x": x})
+        # 0-d NumPy scalars drag every downstream abs/arithmetic through
+        # NumPy dispatch; collapse them to plain floats at the boundary.
+        return value if isinstance(value, np.ndarray) else float(value)
     return f
 
-def bisection(f, a, b, tol=1e-6, max_iter=100):
+def get_fdf(f_expression, df_expression):
+    """
+    Build a joint evaluator returning (f(x), df(x)) in a single call.
+
+    When SymPy can parse both expressions, subexpressions shared between
+    the function and its derivative (e.g. exp(x) in x*exp(x) - 1 and
+    exp(x)*(x + 1)) are assigned once per call via sympy.cse instead of
+    being recomputed by each. Falls back to evaluating the two compiled
+    expressions separately when parsing fails.
+    """
+    try:
+        x = sympy.Symbol("x")
+        parsed = [sympy.sympify(e.replace("np.", ""), locals={"x": x})
+                  for e in (f_expression, df_expression)]
+        reps, exprs = sympy.cse(parsed)
+        lines = ["def _fdf(x):"]
+        for sym, sub in reps:
+            lines.append(f"    {sym} = {sympy.pycode(sub)}")
+        lines.append(f"    return ({sympy.pycode(exprs[0])}, {sympy.pycode(exprs[1])})")
+        namespace = {"math": math}
+        exec(compile("\n".join(lines), "<fdf>", "exec"), namespace)
+        return namespace["_fdf"]
+    except Exception:
+        f = get_function(f_expression)
+        df = get_function(df_expression)
+        def fdf(x):
+            return f(x), df(x)
+        return fdf
+
+def _last(rows):
+    """
+    Drain a solver row generator keeping only the final row.
+    """
+    row = None
+    for row in rows:
+        pass
+    return float(row[1]), float(row[3]), None
+
+def _collect(rows, max_iter):
+    """
+    Drain a solver row generator into a preallocated iteration array.
+    """
+    iterations = np.empty((max_iter, 4))
+    n = 0
+    for row in rows:
+        iterations[n] = row
+        n += 1
+    return float(iterations[n - 1, 1]), float(iterations[n - 1, 3]), iterations[:n]
+
+def _bisection_iter(f, a, b, fa, fb, tol, max_iter):
+    for i in range(max_iter):
+        # The interval width is a guaranteed bound on the root error and
+        # often drops below tol before |f(c)| does. The last midpoint is
+        # already within that bound, so its f evaluation can be skipped.
+        if i and math.fabs(b - a) < tol:
+            return
+        c = (a + b) / 2
+        fc = f(c)
+        yield (i + 1, c, fc, math.fabs(b - a))
+        if math.fabs(fc) < tol:
+            return
+        same_sign = math.copysign(1.0, fa) == math.copysign(1.0, fc)
+        a, fa, b, fb = (c, fc, b, fb) if same_sign else (a, fa, c, fc)
+
+def bisection(f, a, b, tol=1e-6, max_iter=100, stream=False, log_iters=True):
     """
     Bisection method for finding the root of a function.
 
@@ -19,27 +107,51 @@ def bisection(f, a, b, tol=1e-6, max_iter=100):
         b (float): The end of the interval.
         tol (float): The tolerance for the root.
         max_iter (int): The maximum number of iterations.
+        stream (bool): When True, return a generator of
+            (iteration, root, f(root), error) rows instead of building
+            the full iteration log in memory.
+        log_iters (bool): When False, skip the iteration log entirely
+            and return None in its place.
 
     Returns:
         tuple: A tuple containing the root, the error, and the number of iterations.
     """
-    if f(a) * f(b) >= 0:
+    fa = f(a)
+    fb = f(b)
+    if fa * fb >= 0:
         print("Bisection method fails.")
         return None, None, None
 
-    iterations = []
+    rows = _bisection_iter(f, a, b, fa, fb, tol, max_iter)
+    if stream:
+        return rows
+    if not log_iters:
+        return _last(rows)
+    return _collect(rows, max_iter)
+
+def _regula_falsi_iter(f, a, b, fa, fb, tol, max_iter):
+    c_prev = a
+    stalled = 0
     for i in range(max_iter):
-        c = (a + b) / 2
-        iterations.append([i + 1, c, f(c), abs(b - a)])
-        if abs(f(c)) < tol:
-            return c, abs(b - a), iterations
-        if f(a) * f(c) < 0:
-            b = c
+        c = (a * fb - b * fa) / (fb - fa)
+        fc = f(c)
+        yield (i + 1, c, fc, math.fabs(b - a))
+        if math.fabs(fc) < tol:
+            return
+        # False position can stagnate against one endpoint of a convex
+        # function without |f(c)| ever passing the residual test; stop
+        # once the iterate has stopped moving for two iterations.
+        if i and math.fabs(c - c_prev) < tol * math.fabs(c):
+            stalled += 1
+            if stalled >= 2:
+                return
         else:
-            a = c
-    return c, abs(b - a), iterations
+            stalled = 0
+        c_prev = c
+        same_sign = math.copysign(1.0, fa) == math.copysign(1.0, fc)
+        a, fa, b, fb = (c, fc, b, fb) if same_sign else (a, fa, c, fc)
 
-def regula_falsi(f, a, b, tol=1e-6, max_iter=100):
+def regula_falsi(f, a, b, tol=1e-6, max_iter=100, stream=False, log_iters=True):
     """
     Regula Falsi (False Position) method for finding the root of a function.
 
@@ -49,27 +161,101 @@ def regula_falsi(f, a, b, tol=1e-6, max_iter=100):
         b (float): The end of the interval.
         tol (float): The tolerance for the root.
         max_iter (int): The maximum number of iterations.
+        stream (bool): When True, return a generator of
+            (iteration, root, f(root), error) rows instead of building
+            the full iteration log in memory.
+        log_iters (bool): When False, skip the iteration log entirely
+            and return None in its place.
 
     Returns:
         tuple: A tuple containing the root, the error, and the number of iterations.
     """
-    if f(a) * f(b) >= 0:
+    fa = f(a)
+    fb = f(b)
+    if fa * fb >= 0:
         print("Regula Falsi method fails.")
         return None, None, None
 
-    iterations = []
+    rows = _regula_falsi_iter(f, a, b, fa, fb, tol, max_iter)
+    if stream:
+        return rows
+    if not log_iters:
+        return _last(rows)
+    return _collect(rows, max_iter)
+
+def _mod_anderson_bjork_iter(f, a, b, fa, fb, tol, max_iter):
+    prev_width = math.fabs(b - a)
     for i in range(max_iter):
-        c = (a * f(b) - b * f(a)) / (f(b) - f(a))
-        iterations.append([i + 1, c, f(c), abs(b - a)])
-        if abs(f(c)) < tol:
-            return c, abs(b - a), iterations
-        if f(a) * f(c) < 0:
-            b = c
+        c = (a * fb - b * fa) / (fb - fa)
+        if (i + 1) % 4 == 0:
+            if math.fabs(b - a) > 0.5 * prev_width:
+                c = (a + b) / 2
+            prev_width = math.fabs(b - a)
+        fc = f(c)
+        yield (i + 1, c, fc, math.fabs(b - a))
+        if math.fabs(fc) < tol:
+            return
+        if math.copysign(1.0, fc) == math.copysign(1.0, fb):
+            g = 1 - fc / fb
+            if g <= 0:
+                g = 0.5
+            fa *= g
+            b, fb = c, fc
         else:
-            a = c
-    return c, abs(b - a), iterations
+            a, fa = b, fb
+            b, fb = c, fc
+
+def mod_anderson_bjork(f, a, b, tol=1e-6, max_iter=100, stream=False, log_iters=True):
+    """
+    Modified Anderson-Bjorck method for finding the root of a function.
+
+    Keeps the guaranteed bracket of Regula Falsi but converges
+    superlinearly: when the new point lands on the same side as the last
+    one, the retained endpoint's function value is scaled by the
+    Anderson-Bjorck weight so the bracket cannot stagnate, and a plain
+    bisection step is forced whenever the interval stops shrinking.
+
+    Args:
+        f (function): The function for which to find the root.
+        a (float): The start of the interval.
+        b (float): The end of the interval.
+        tol (float): The tolerance for the root.
+        max_iter (int): The maximum number of iterations.
+        stream (bool): When True, return a generator of
+            (iteration, root, f(root), error) rows instead of building
+            the full iteration log in memory.
+        log_iters (bool): When False, skip the iteration log entirely
+            and return None in its place.
+
+    Returns:
+        tuple: A tuple containing the root, the error, and the number of iterations.
+    """
+    fa = f(a)
+    fb = f(b)
+    if fa * fb >= 0:
+        print("Modified Anderson-Bjorck method fails.")
+        return None, None, None
+
+    rows = _mod_anderson_bjork_iter(f, a, b, fa, fb, tol, max_iter)
+    if stream:
+        return rows
+    if not log_iters:
+        return _last(rows)
+    return _collect(rows, max_iter)
 
-def secant(f, x0, x1, tol=1e-6, max_iter=100):
+def _secant_iter(f, x0, x1, tol, max_iter):
+    fx0 = f(x0)
+    fx1 = f(x1)
+    for i in range(max_iter):
+        x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
+        fx2 = f(x2)
+        yield (i + 1, x2, fx2, math.fabs(x2 - x1))
+        if math.fabs(fx2) < tol:
+            return
+        x0, fx0 = x1, fx1
+        x1, fx1 = x2, fx2
+
+def secant(f, x0, x1, tol=1e-6, max_iter=100, stream=False, log_iters=True):
     """
     Secant method for finding the root of a function.
 
@@ -79,44 +265,86 @@ def secant(f, x0, x1, tol=1e-6, max_iter=100):
         x1 (float): The second initial guess.
         tol (float): The tolerance for the root.
         max_iter (int): The maximum number of iterations.
+        stream (bool): When True, return a generator of
+            (iteration, root, f(root), error) rows instead of building
+            the full iteration log in memory.
+        log_iters (bool): When False, skip the iteration log entirely
+            and return None in its place.
 
     Returns:
         tuple: A tuple containing the root, the error, and the number of iterations.
     """
-    iterations = []
+    rows = _secant_iter(f, x0, x1, tol, max_iter)
+    if stream:
+        return rows
+    if not log_iters:
+        return _last(rows)
+    return _collect(rows, max_iter)
+
+def _newton_raphson_iter(fdf, x0, tol, max_iter):
+    fx0, dfx0 = fdf(x0)
     for i in range(max_iter):
-        x2 = x1 - f(x1) * (x1 - x0) / (f(x1) - f(x0))
-        iterations.append([i + 1, x2, f(x2), abs(x2 - x1)])
-        if abs(f(x2)) < tol:
-            return x2, abs(x2 - x1), iterations
-        x0 = x1
-        x1 = x2
-    return x2, abs(x2 - x1), iterations
+        x1 = x0 - fx0 / dfx0
+        fx1, dfx1 = fdf(x1)
+        yield (i + 1, x1, fx1, math.fabs(x1 - x0))
+        if math.fabs(fx1) < tol:
+            return
+        x0, fx0, dfx0 = x1, fx1, dfx1
 
-def newton_raphson(f, df, x0, tol=1e-6, max_iter=100):
+def newton_raphson(f, df, x0, tol=1e-6, max_iter=100, stream=False, log_iters=True):
     """
     Newton-Raphson method for finding the root of a function.
 
     Args:
-        f (function): The function for which to find the root.
-        df (function): The derivative of the function.
+        f (function): The function for which to find the root, or a joint
+            evaluator returning (f(x), df(x)) when df is None (see get_fdf).
+        df (function): The derivative of the function, or None when f is
+            a joint evaluator.
         x0 (float): The initial guess.
         tol (float): The tolerance for the root.
         max_iter (int): The maximum number of iterations.
+        stream (bool): When True, return a generator of
+            (iteration, root, f(root), error) rows instead of building
+            the full iteration log in memory.
+        log_iters (bool): When False, skip the iteration log entirely
+            and return None in its place.
 
     Returns:
         tuple: A tuple containing the root, the error, and the number of iterations.
     """
-    iterations = []
+    fdf = f if df is None else lambda x: (f(x), df(x))
+    rows = _newton_raphson_iter(fdf, x0, tol, max_iter)
+    if stream:
+        return rows
+    if not log_iters:
+        return _last(rows)
+    return _collect(rows, max_iter)
+
+def _fixed_point_iter(g, x0, tol, max_iter):
     for i in range(max_iter):
-        x1 = x0 - f(x0) / df(x0)
-        iterations.append([i + 1, x1, f(x1), abs(x1 - x0)])
-        if abs(f(x1)) < tol:
-            return x1, abs(x1 - x0), iterations
+        x1 = g(x0)
+        yield (i + 1, x1, x1 - g(x1), math.fabs(x1 - x0))
+        if math.fabs(x1 - x0) < tol:
+            return
         x0 = x1
-    return x1, abs(x1 - x0), iterations
 
-def fixed_point_iteration(g, x0, tol=1e-6, max_iter=100):
+def _steffensen_iter(g, x0, tol, max_iter):
+    for i in range(max_iter):
+        x1 = g(x0)
+        x2 = g(x1)
+        denom = x2 - 2 * x1 + x0
+        # Aitken's delta-squared update; fall back to the plain iterate
+        # when the denominator underflows near the fixed point.
+        if math.fabs(denom) > 1e-300:
+            x_new = x0 - (x1 - x0) ** 2 / denom
+        else:
+            x_new = x2
+        yield (i + 1, x_new, x_new - g(x_new), math.fabs(x_new - x0))
+        if math.fabs(x_new - x0) < tol:
+            return
+        x0 = x_new
+
+def fixed_point_iteration(g, x0, tol=1e-6, max_iter=100, stream=False, accelerate=False, log_iters=True):
     """
     Fixed Point Iteration method for finding the root of a function.
 
@@ -125,20 +353,40 @@ def fixed_point_iteration(g, x0, tol=1e-6, max_iter=100):
         x0 (float): The initial guess.
         tol (float): The tolerance for the root.
         max_iter (int): The maximum number of iterations.
+        stream (bool): When True, return a generator of
+            (iteration, root, f(root), error) rows instead of building
+            the full iteration log in memory.
+        accelerate (bool): When True, apply Aitken's delta-squared
+            transform every step (Steffensen's method), turning the
+            linear convergence quadratic at the cost of one extra g
+            evaluation per iteration.
+        log_iters (bool): When False, skip the iteration log entirely
+            and return None in its place.
 
     Returns:
         tuple: A tuple containing the root, the error, and the number of iterations.
     """
-    iterations = []
+    rows = (_steffensen_iter if accelerate else _fixed_point_iter)(g, x0, tol, max_iter)
+    if stream:
+        return rows
+    if not log_iters:
+        return _last(rows)
+    return _collect(rows, max_iter)
+
+def _modified_secant_iter(f, x0, delta, tol, max_iter):
+    fx0 = f(x0)
+    # Only the perturbed evaluation and the residual f(x1) remain per
+    # iteration, and x1 depends on the former, so the two calls cannot
+    # be packed into one array evaluation.
     for i in range(max_iter):
-        x1 = g(x0)
-        iterations.append([i + 1, x1, x1 - g(x1), abs(x1 - x0)])
-        if abs(x1 - x0) < tol:
-            return x1, abs(x1 - x0), iterations
-        x0 = x1
-    return x1, abs(x1 - x0), iterations
+        x1 = x0 - fx0 * delta * x0 / (f(x0 + delta * x0) - fx0)
+        fx1 = f(x1)
+        yield (i + 1, x1, fx1, math.fabs(x1 - x0))
+        if math.fabs(fx1) < tol:
+            return
+        x0, fx0 = x1, fx1
 
-def modified_secant(f, x0, delta=1e-6, tol=1e-6, max_iter=100):
+def modified_secant(f, x0, delta=1e-6, tol=1e-6, max_iter=100, stream=False, log_iters=True):
     """
     Modified Secant method for finding the root of a function.
 
@@ -148,23 +396,249 @@ def modified_secant(f, x0, delta=1e-6, tol=1e-6, max_iter=100):
         delta (float): A small perturbation value.
         tol (float): The tolerance for the root.
         max_iter (int): The maximum number of iterations.
+        stream (bool): When True, return a generator of
+            (iteration, root, f(root), error) rows instead of building
+            the full iteration log in memory.
+        log_iters (bool): When False, skip the iteration log entirely
+            and return None in its place.
 
     Returns:
         tuple: A tuple containing the root, the error, and the number of iterations.
     """
-    iterations = []
+    rows = _modified_secant_iter(f, x0, delta, tol, max_iter)
+    if stream:
+        return rows
+    if not log_iters:
+        return _last(rows)
+    return _collect(rows, max_iter)
+
+def bisection_batch(f, a, b, tol=1e-6, max_iter=100):
+    """
+    Bisection method over many independent intervals at once.
+
+    All intervals are advanced in lock-step with masked NumPy updates,
+    which amortizes the interpreter overhead over the whole batch. The
+    per-iteration log is skipped in batch mode.
+
+    Args:
+        f (function): The function for which to find the roots. It must
+            accept and return NumPy arrays (functions from get_function do).
+        a (array_like): The starts of the intervals.
+        b (array_like): The ends of the intervals.
+        tol (float): The tolerance for the roots.
+        max_iter (int): The maximum number of iterations.
+
+    Returns:
+        tuple: A tuple containing the roots, the errors, and the number of iterations.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    fa = f(a)
+    fb = f(b)
+    if np.any(fa * fb >= 0):
+        print("Bisection method fails.")
+        return None, None, None
+
+    c = (a + b) / 2
     for i in range(max_iter):
-        x1 = x0 - f(x0) * delta * x0 / (f(x0 + delta * x0) - f(x0))
-        iterations.append([i + 1, x1, f(x1), abs(x1 - x0)])
-        if abs(f(x1)) < tol:
-            return x1, abs(x1 - x0), iterations
-        x0 = x1
-    return x1, abs(x1 - x0), iterations
+        c = (a + b) / 2
+        fc = f(c)
+        if np.all(np.abs(fc) < tol):
+            return c, np.abs(b - a), i + 1
+        left = np.signbit(fa) ^ np.signbit(fc)
+        b = np.where(left, c, b)
+        fb = np.where(left, fc, fb)
+        a = np.where(left, a, c)
+        fa = np.where(left, fa, fc)
+    return c, np.abs(b - a), max_iter
+
+def make_bisection(f_jit):
+    """
+    Build a Numba-compiled bisection solver closed over a jitted function.
+
+    Args:
+        f_jit (function): A Numba-jitted function, e.g. from get_function.
+
+    Returns:
+        function: A jitted solver(a, b, tol, max_iter) returning the root,
+        the error, and the iterations as a NumPy array.
+    """
+    @njit
+    def _bisection(a, b, tol, max_iter):
+        fa = f_jit(a)
+        fb = f_jit(b)
+        iterations = np.empty((max_iter, 4))
+        c = (a + b) / 2
+        for i in range(max_iter):
+            c = (a + b) / 2
+            fc = f_jit(c)
+            iterations[i, 0] = i + 1
+            iterations[i, 1] = c
+            iterations[i, 2] = fc
+            iterations[i, 3] = abs(b - a)
+            if abs(fc) < tol:
+                return c, abs(b - a), iterations[:i + 1]
+            if fa * fc < 0:
+                b, fb = c, fc
+            else:
+                a, fa = c, fc
+        return c, abs(b - a), iterations
+    return _bisection
+
+def make_regula_falsi(f_jit):
+    """
+    Build a Numba-compiled Regula Falsi solver closed over a jitted function.
+
+    Args:
+        f_jit (function): A Numba-jitted function, e.g. from get_function.
+
+    Returns:
+        function: A jitted solver(a, b, tol, max_iter) returning the root,
+        the error, and the iterations as a NumPy array.
+    """
+    @njit
+    def _regula_falsi(a, b, tol, max_iter):
+        fa = f_jit(a)
+        fb = f_jit(b)
+        iterations = np.empty((max_iter, 4))
+        c = a
+        for i in range(max_iter):
+            c = (a * fb - b * fa) / (fb - fa)
+            fc = f_jit(c)
+            iterations[i, 0] = i + 1
+            iterations[i, 1] = c
+            iterations[i, 2] = fc
+            iterations[i, 3] = abs(b - a)
+            if abs(fc) < tol:
+                return c, abs(b - a), iterations[:i + 1]
+            if fa * fc < 0:
+                b, fb = c, fc
+            else:
+                a, fa = c, fc
+        return c, abs(b - a), iterations
+    return _regula_falsi
+
+def make_secant(f_jit):
+    """
+    Build a Numba-compiled secant solver closed over a jitted function.
+
+    Args:
+        f_jit (function): A Numba-jitted function, e.g. from get_function.
+
+    Returns:
+        function: A jitted solver(x0, x1, tol, max_iter) returning the root,
+        the error, and the iterations as a NumPy array.
+    """
+    @njit
+    def _secant(x0, x1, tol, max_iter):
+        fx0 = f_jit(x0)
+        fx1 = f_jit(x1)
+        iterations = np.empty((max_iter, 4))
+        x2 = x1
+        for i in range(max_iter):
+            x2 = x1 - fx1 * (x1 - x0) / (fx1 - fx0)
+            fx2 = f_jit(x2)
+            iterations[i, 0] = i + 1
+            iterations[i, 1] = x2
+            iterations[i, 2] = fx2
+            iterations[i, 3] = abs(x2 - x1)
+            if abs(fx2) < tol:
+                return x2, abs(x2 - x1), iterations[:i + 1]
+            x0, fx0 = x1, fx1
+            x1, fx1 = x2, fx2
+        return x2, abs(x2 - x1), iterations
+    return _secant
+
+def make_newton_raphson(f_jit, df_jit):
+    """
+    Build a Numba-compiled Newton-Raphson solver closed over jitted functions.
+
+    Args:
+        f_jit (function): A Numba-jitted function, e.g. from get_function.
+        df_jit (function): The jitted derivative of the function.
+
+    Returns:
+        function: A jitted solver(x0, tol, max_iter) returning the root,
+        the error, and the iterations as a NumPy array.
+    """
+    @njit
+    def _newton_raphson(x0, tol, max_iter):
+        iterations = np.empty((max_iter, 4))
+        fx0 = f_jit(x0)
+        x1 = x0
+        for i in range(max_iter):
+            x1 = x0 - fx0 / df_jit(x0)
+            fx1 = f_jit(x1)
+            iterations[i, 0] = i + 1
+            iterations[i, 1] = x1
+            iterations[i, 2] = fx1
+            iterations[i, 3] = abs(x1 - x0)
+            if abs(fx1) < tol:
+                return x1, abs(x1 - x0), iterations[:i + 1]
+            x0, fx0 = x1, fx1
+        return x1, abs(x1 - x0), iterations
+    return _newton_raphson
+
+def make_fixed_point_iteration(g_jit):
+    """
+    Build a Numba-compiled Fixed Point Iteration solver closed over a jitted g.
+
+    Args:
+        g_jit (function): A Numba-jitted g(x) function, e.g. from get_function.
+
+    Returns:
+        function: A jitted solver(x0, tol, max_iter) returning the root,
+        the error, and the iterations as a NumPy array.
+    """
+    @njit
+    def _fixed_point_iteration(x0, tol, max_iter):
+        iterations = np.empty((max_iter, 4))
+        x1 = x0
+        for i in range(max_iter):
+            x1 = g_jit(x0)
+            iterations[i, 0] = i + 1
+            iterations[i, 1] = x1
+            iterations[i, 2] = x1 - g_jit(x1)
+            iterations[i, 3] = abs(x1 - x0)
+            if abs(x1 - x0) < tol:
+                return x1, abs(x1 - x0), iterations[:i + 1]
+            x0 = x1
+        return x1, abs(x1 - x0), iterations
+    return _fixed_point_iteration
+
+def make_modified_secant(f_jit):
+    """
+    Build a Numba-compiled Modified Secant solver closed over a jitted function.
+
+    Args:
+        f_jit (function): A Numba-jitted function, e.g. from get_function.
+
+    Returns:
+        function: A jitted solver(x0, delta, tol, max_iter) returning the
+        root, the error, and the iterations as a NumPy array.
+    """
+    @njit
+    def _modified_secant(x0, delta, tol, max_iter):
+        fx0 = f_jit(x0)
+        iterations = np.empty((max_iter, 4))
+        x1 = x0
+        for i in range(max_iter):
+            x1 = x0 - fx0 * delta * x0 / (f_jit(x0 + delta * x0) - fx0)
+            fx1 = f_jit(x1)
+            iterations[i, 0] = i + 1
+            iterations[i, 1] = x1
+            iterations[i, 2] = fx1
+            iterations[i, 3] = abs(x1 - x0)
+            if abs(fx1) < tol:
+                return x1, abs(x1 - x0), iterations[:i + 1]
+            x0, fx0 = x1, fx1
+        return x1, abs(x1 - x0), iterations
+    return _modified_secant
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Zero of Functions (ZOF) Solver")
     parser.add_argument("method", help="The root-finding method to use.",
-                        choices=["bisection", "regula_falsi", "secant", "newton_raphson", "fixed_point", "modified_secant"])
+                        choices=["bisection", "regula_falsi", "mod_ab", "secant", "newton_raphson", "fixed_point", "modified_secant"])
     parser.add_argument("expression", help="The function to solve, in terms of x.")
     parser.add_argument("params", help="Method-specific parameters.", nargs="+", type=float)
     parser.add_argument("--tol", help="The tolerance for the root.", type=float, default=1e-6)
@@ -172,6 +646,7 @@ if __name__ == "__main__":
     parser.add_argument("--delta", help="Delta for modified secant method.", type=float, default=1e-6)
     parser.add_argument("--df", help="The derivative of the function for Newton-Raphson method.")
     parser.add_argument("--g", help="The g(x) function for Fixed Point Iteration.")
+    parser.add_argument("--accelerate", help="Apply Steffensen (Aitken delta-squared) acceleration to Fixed Point Iteration.", action="store_true")
 
     args = parser.parse_args()
 
@@ -191,6 +666,12 @@ if __name__ == "__main__":
         else:
             a, b = args.params
             root, error, iterations = regula_falsi(f, a, b, args.tol, args.max_iter)
+    elif args.method == "mod_ab":
+        if len(args.params) != 2:
+            print("Modified Anderson-Bjorck method requires two parameters: a and b.")
+        else:
+            a, b = args.params
+            root, error, iterations = mod_anderson_bjork(f, a, b, args.tol, args.max_iter)
     elif args.method == "secant":
         if len(args.params) != 2:
             print("Secant method requires two parameters: x0 and x1.")
@@ -203,9 +684,9 @@ if __name__ == "__main__":
         elif not args.df:
             print("Newton-Raphson method requires the derivative of the function (--df).")
         else:
-            df = get_function(args.df)
+            fdf = get_fdf(args.expression, args.df)
             x0 = args.params[0]
-            root, error, iterations = newton_raphson(f, df, x0, args.tol, args.max_iter)
+            root, error, iterations = newton_raphson(fdf, None, x0, args.tol, args.max_iter)
     elif args.method == "fixed_point":
         if len(args.params) != 1:
             print("Fixed Point Iteration method requires one parameter: x0.")
@@ -214,7 +695,7 @@ if __name__ == "__main__":
         else:
             g = get_function(args.g)
             x0 = args.params[0]
-            root, error, iterations = fixed_point_iteration(g, x0, args.tol, args.max_iter)
+            root, error, iterations = fixed_point_iteration(g, x0, args.tol, args.max_iter, accelerate=args.accelerate)
     elif args.method == "modified_secant":
         if len(args.params) != 1:
             print("Modified Secant method requires one parameter: x0.")
@@ -225,8 +706,9 @@ if __name__ == "__main__":
     if root is not None and iterations is not None:
         print(f"\n{args.method.replace('_', ' ').title()} Method:")
         print("Iteration | Root | f(x) | Error")
-        for i in iterations:
-            print(f"{i[0]:<9} | {i[1]:<20} | {i[2]:<20} | {i[3]:<20}")
+        sys.stdout.write("\n".join(
+            f"{int(row[0]):<9} | {row[1]:<20} | {row[2]:<20} | {row[3]:<20}"
+            for row in iterations) + "\n")
         print(f"\nFinal Root: {root}")
         print(f"Final Error: {error}")
         print(f"Iterations: {len(iterations)}")
@@ -1,49 +1,46 @@
+from functools import lru_cache
+
 from flask import Flask, render_template, request
-from ZOF_CLI import bisection, regula_falsi, secant, newton_raphson, fixed_point_iteration, modified_secant, get_function
+from ZOF_CLI import bisection, regula_falsi, mod_anderson_bjork, secant, newton_raphson, fixed_point_iteration, modified_secant, get_function
 
 app = Flask(__name__)
 
+# method -> (solver, form fields compiled to functions, form fields parsed as floats)
+SOLVERS = {
+    "bisection": (bisection, ("expression",), ("param1", "param2")),
+    "regula_falsi": (regula_falsi, ("expression",), ("param1", "param2")),
+    "mod_ab": (mod_anderson_bjork, ("expression",), ("param1", "param2")),
+    "secant": (secant, ("expression",), ("param1", "param2")),
+    "newton_raphson": (newton_raphson, ("expression", "df"), ("param1",)),
+    "fixed_point": (fixed_point_iteration, ("g",), ("param1",)),
+    "modified_secant": (modified_secant, ("expression",), ("param1", "delta")),
+}
+
+@lru_cache(maxsize=256)
+def _compiled(expression):
+    """
+    Compile an expression once and reuse it across requests.
+
+    get_function may hand back a Numba-jitted function, so caching also
+    amortizes the JIT warmup over repeated form submissions.
+    """
+    return get_function(expression)
+
 @app.route('/')
 def index():
     return render_template('index.html')
 
 @app.route('/solve', methods=['POST'])
 def solve():
-    expression = request.form['expression']
     method = request.form['method']
     tol = float(request.form['tol'])
     max_iter = int(request.form['max_iter'])
 
-    f = get_function(expression)
-    
-    root, error, iterations = None, None, None
-
-    if method == "bisection":
-        a = float(request.form['param1'])
-        b = float(request.form['param2'])
-        root, error, iterations = bisection(f, a, b, tol, max_iter)
-    elif method == "regula_falsi":
-        a = float(request.form['param1'])
-        b = float(request.form['param2'])
-        root, error, iterations = regula_falsi(f, a, b, tol, max_iter)
-    elif method == "secant":
-        x0 = float(request.form['param1'])
-        x1 = float(request.form['param2'])
-        root, error, iterations = secant(f, x0, x1, tol, max_iter)
-    elif method == "newton_raphson":
-        x0 = float(request.form['param1'])
-        df_str = request.form['df']
-        df = get_function(df_str)
-        root, error, iterations = newton_raphson(f, df, x0, tol, max_iter)
-    elif method == "fixed_point":
-        x0 = float(request.form['param1'])
-        g_str = request.form['g']
-        g = get_function(g_str)
-        root, error, iterations = fixed_point_iteration(g, x0, tol, max_iter)
-    elif method == "modified_secant":
-        x0 = float(request.form['param1'])
-        delta = float(request.form['delta'])
-        root, error, iterations = modified_secant(f, x0, delta, tol, max_iter)
+    fn, func_keys, param_keys = SOLVERS[method]
+    funcs = [_compiled(request.form[k]) for k in func_keys]
+    params = [float(request.form[k]) for k in param_keys]
+    full = request.args.get('full', '1') != '0'
+    root, error, iterations = fn(*funcs, *params, tol, max_iter, log_iters=full)
 
     return render_template('index.html', root=root, error=error, iterations=iterations, method=method)
 